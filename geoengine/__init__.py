@@ -1,6 +1,5 @@
 '''Entry point for Geo Engine Python Library'''
 
-from pkg_resources import get_distribution
 from requests import utils
 from pydantic import ValidationError
 
@@ -9,8 +8,8 @@ from geoengine_openapi_client.exceptions import BadRequestException, OpenApiExce
 from .auth import Session, get_session, initialize, reset
 from .colorizer import Colorizer, ColorBreakpoint, LinearGradientColorizer, PaletteColorizer, \
     LogarithmicGradientColorizer
-from .datasets import upload_dataframe, StoredDataset, add_dataset, volumes, AddDatasetProperties, \
-    delete_dataset, list_datasets, DatasetListOrder, OgrSourceDatasetTimeType, OgrOnError
+from .datasets import upload_dataframe, upload_dataframe_async, StoredDataset, add_dataset, volumes, \
+    AddDatasetProperties, delete_dataset, list_datasets, DatasetListOrder, OgrSourceDatasetTimeType, OgrOnError
 from .error import GeoEngineException, InputException, UninitializedException, TypeException, \
     MethodNotCalledOnPlotException, MethodNotCalledOnRasterException, MethodNotCalledOnVectorException, \
     SpatialReferenceMismatchException, check_response_for_error, ModificationNotOnLayerDbException, \
@@ -32,10 +31,10 @@ from .workflow import WorkflowId, Workflow, workflow_by_id, register_workflow, g
 from .raster import RasterTile2D
 from .raster_workflow_rio_writer import RasterWorkflowRioWriter
 
-from . import workflow_builder
+from . import util, workflow_builder
 
 
-DEFAULT_USER_AGENT = f'geoengine-python/{get_distribution("geoengine").version}'
+DEFAULT_USER_AGENT = util.user_agent()
 
 
 def default_user_agent(_name="python-requests"):
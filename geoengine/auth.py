@@ -3,19 +3,37 @@ Module for encapsulating Geo Engine authentication
 '''
 
 from __future__ import annotations
-from typing import ClassVar, Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import blake2b
+from logging import warning
+from typing import Any, ClassVar, Dict, Optional, Tuple
 from uuid import UUID
 
 import os
+import time
 from dotenv import load_dotenv
-from pkg_resources import get_distribution
+import orjson
 from requests.auth import AuthBase
 import urllib3
+from urllib3.util.retry import Retry
 
 import geoengine_openapi_client
+from geoengine import util
 from geoengine.error import GeoEngineException, MethodOnlyAvailableInGeoEnginePro, UninitializedException
 
 
+# Retry transient connection errors and gateway errors of idempotent requests with exponential backoff.
+# `POST`s are only retried if the connection could not be established, so that uploads are not duplicated.
+# The last gateway error response is returned instead of raised, so that it reaches the usual error handling.
+DEFAULT_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+
+# Executor for requests whose result is not awaited, e.g., logouts
+_background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='geoengine')
+
+
 class BearerAuth(AuthBase):  # pylint: disable=too-few-public-methods
     '''A bearer token authentication for `requests`'''
 
@@ -29,7 +47,7 @@ class BearerAuth(AuthBase):  # pylint: disable=too-few-public-methods
         return r
 
 
-class Session:
+class Session:  # pylint: disable=too-many-instance-attributes
     '''
     A Geo Engine session
     '''
@@ -40,9 +58,20 @@ class Session:
     __server_url: str
     __timeout: int = 60
     __configuration: geoengine_openapi_client.Configuration
+    __api_client: geoengine_openapi_client.ApiClient
+    __auth_header: Dict[str, str]
+    __bearer_auth: BearerAuth
 
     session: ClassVar[Optional[Session]] = None
 
+    # Shared connection pool for the manual session requests. Repeated logins reuse its connections (keep-alive).
+    http: ClassVar[urllib3.PoolManager] = urllib3.PoolManager(num_pools=10, maxsize=20, retries=DEFAULT_RETRIES)
+
+    # Validated token sessions by `(server_url, token hash)` with their expiry as UNIX timestamp
+    __token_sessions: ClassVar[Dict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]]] = {}
+    __token_expiry_skew: ClassVar[float] = 60.0
+    __background_logout_timeout: ClassVar[int] = 2
+
     def __init__(self,
                  server_url: str,
                  credentials: Optional[Tuple[str, str]] = None,
@@ -70,57 +99,39 @@ class Session:
 
         # Auto-generated SessionApi cannot handle dynamically differing return types (SimpleSession or UserSession).
         # Because of that requests must be send manually.
-        http = urllib3.PoolManager()
-        user_agent = f'geoengine-python/{get_distribution("geoengine").version}'
+        http = Session.http
+        user_agent = util.user_agent()
+
+        # resolve the environment once, credentials take precedence over tokens
+        if credentials is None and "GEOENGINE_EMAIL" in os.environ and "GEOENGINE_PASSWORD" in os.environ:
+            credentials = (os.environ["GEOENGINE_EMAIL"], os.environ["GEOENGINE_PASSWORD"])
+        if token is None:
+            token = os.environ.get("GEOENGINE_TOKEN")
 
         if credentials is not None:
-            session = http.request(
-                "POST",
-                f'{server_url}/login',
-                headers={'User-Agent': user_agent},
-                json={"email": credentials[0], "password": credentials[1]},
-                timeout=self.__timeout
-            ).json()
-        elif "GEOENGINE_EMAIL" in os.environ and "GEOENGINE_PASSWORD" in os.environ:
-            session = http.request(
+            session = orjson.loads(http.request(
                 "POST",
                 f'{server_url}/login',
-                headers={'User-Agent': user_agent},
-                json={"email": os.environ.get("GEOENGINE_EMAIL"), "password": os.environ.get("GEOENGINE_PASSWORD")},
+                headers={'User-Agent': user_agent, 'Content-Type': 'application/json'},
+                body=orjson.dumps({"email": credentials[0], "password": credentials[1]}),
                 timeout=self.__timeout
-            ).json()
+            ).data)
         elif token is not None:
-            session = http.request(
-                "GET",
-                f'{server_url}/session',
-                headers={
-                    'User-Agent': user_agent,
-                    'Authorization': f'Bearer {token}'
-                },
-                timeout=self.__timeout
-            ).json()
-        elif "GEOENGINE_TOKEN" in os.environ:
-            session = http.request(
-                "GET",
-                f'{server_url}/session',
-                headers={
-                    'User-Agent': user_agent,
-                    'Authorization': f'Bearer {os.environ.get("GEOENGINE_TOKEN")}'
-                },
-                timeout=self.__timeout
-            ).json()
+            session = self.__token_session(server_url, token, user_agent)
         else:
-            session = http.request(
+            session = orjson.loads(http.request(
                 "POST",
                 f'{server_url}/anonymous',
                 headers={'User-Agent': user_agent},
                 timeout=self.__timeout
-            ).json()
+            ).data)
 
-        if 'error' in session:
+        if session.get('error') is not None:
             raise GeoEngineException(session)
 
         self.__id = session['id']
+        self.__auth_header = {'Authorization': f'Bearer {self.__id}'}
+        self.__bearer_auth = BearerAuth(str(self.__id))
 
         try:
             self.__user_id = session['user']['id']
@@ -139,6 +150,41 @@ class Session:
             host=server_url,
             access_token=session['id']
         )
+        self.__configuration.retries = DEFAULT_RETRIES  # type: ignore
+        self.__api_client = geoengine_openapi_client.ApiClient(self.__configuration)
+
+    def __token_session(self, server_url: str, token: str, user_agent: str) -> Dict[str, Any]:
+        '''
+        Validate a token by requesting its session
+
+        Valid sessions are cached until shortly before they expire. Re-initializing with the same token
+        does not require another round-trip to the server.
+        '''
+
+        cache_key = (server_url, _token_key(token))
+        cached = Session.__token_sessions.get(cache_key)
+        if cached is not None:
+            (expires_at, session) = cached
+            if expires_at - Session.__token_expiry_skew > time.time():
+                return session
+            del Session.__token_sessions[cache_key]
+
+        session = orjson.loads(Session.http.request(
+            "GET",
+            f'{server_url}/session',
+            headers={
+                'User-Agent': user_agent,
+                'Authorization': f'Bearer {token}'
+            },
+            timeout=self.__timeout
+        ).data)
+
+        if session.get('error') is None and session.get('validUntil') is not None:
+            # RFC 3339 in UTC, e.g. `2021-06-08T16:22:22.605892183Z`, seconds precision is sufficient
+            expires_at = datetime.fromisoformat(session['validUntil'][:19]).replace(tzinfo=timezone.utc).timestamp()
+            Session.__token_sessions[cache_key] = (expires_at, session)
+
+        return session
 
     def __repr__(self) -> str:
         '''Display representation of a session'''
@@ -158,10 +204,10 @@ class Session:
     @property
     def auth_header(self) -> Dict[str, str]:
         '''
-        Create an authentication header for the current session
+        Return the authentication header for the current session
         '''
 
-        return {'Authorization': 'Bearer ' + str(self.__id)}
+        return self.__auth_header
 
     @property
     def server_url(self) -> str:
@@ -179,6 +225,16 @@ class Session:
 
         return self.__configuration
 
+    @property
+    def api_client(self) -> geoengine_openapi_client.ApiClient:
+        '''
+        Return the API client of the current session
+
+        It is shared by all requests of the session, so that consecutive requests reuse pooled connections.
+        '''
+
+        return self.__api_client
+
     @property
     def user_id(self) -> UUID:
         '''
@@ -194,16 +250,55 @@ class Session:
         Return a Bearer authentication object for the current session
         '''
 
-        return BearerAuth(str(self.__id))
+        return self.__bearer_auth
 
-    def logout(self):
+    def logout(self, sync: bool = False) -> None:
         '''
         Logout the current session
+
+        By default, the logout request is sent in the background and the caller does not wait for it.
+        It is sent only once without retries and failures are logged as warnings.
+        Set `sync` to wait for the request and to raise errors.
         '''
 
-        with geoengine_openapi_client.ApiClient(self.configuration) as api_client:
+        Session.__token_sessions.pop((self.server_url, _token_key(str(self.__id))), None)
+
+        if sync:
+            self.__logout(self.api_client, self.__timeout)
+            return
+
+        # a separate client without retries, so that an unreachable server does not delay the interpreter exit
+        configuration = geoengine_openapi_client.Configuration(
+            host=self.server_url,
+            access_token=self.__configuration.access_token
+        )
+        configuration.retries = False  # type: ignore
+        api_client = geoengine_openapi_client.ApiClient(configuration)
+
+        future = _background_executor.submit(self.__logout, api_client, Session.__background_logout_timeout)
+        future.add_done_callback(_log_background_logout_failure)
+
+    @staticmethod
+    def __logout(api_client: geoengine_openapi_client.ApiClient, timeout: int) -> None:
+        '''Send the logout request'''
+
+        with api_client:
             session_api = geoengine_openapi_client.SessionApi(api_client)
-            session_api.logout_handler(_request_timeout=self.__timeout)
+            session_api.logout_handler(_request_timeout=timeout)
+
+
+def _token_key(token: str) -> bytes:
+    '''Hash a token for the session cache, so that the cache keys do not expose raw bearer tokens'''
+
+    return blake2b(token.encode()).digest()
+
+
+def _log_background_logout_failure(future: Future) -> None:
+    '''Log the error of a background logout since nobody awaits its result'''
+
+    error = future.exception()
+    if error is not None:
+        warning('Background logout failed: %s', error)
 
 
 def get_session() -> Session:
@@ -219,6 +314,13 @@ def get_session() -> Session:
     return Session.session
 
 
+@lru_cache(maxsize=None)
+def _load_dotenv_once() -> None:
+    '''Load the `.env` file only on the first call, so that re-initializing does not parse it again'''
+
+    load_dotenv()
+
+
 def initialize(server_url: str,
                credentials: Optional[Tuple[str, str]] = None,
                token: Optional[str] = None) -> None:
@@ -233,7 +335,9 @@ def initialize(server_url: str,
     optional .env file defining: GEOENGINE_EMAIL, GEOENGINE_PASSWORD, GEOENGINE_TOKEN
     '''
 
-    load_dotenv()
+    # with explicit credentials, the environment is never consulted
+    if credentials is None:
+        _load_dotenv_once()
 
     Session.session = Session(server_url, credentials, token)
 
@@ -4,8 +4,9 @@ Module for working with datasets and source definitions
 
 from __future__ import annotations
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Union, Literal
+from typing import Dict, List, NamedTuple, Optional, Union, Literal
 from enum import Enum
 from uuid import UUID
 import tempfile
@@ -13,7 +14,7 @@ from attr import dataclass
 import numpy as np
 import geopandas as gpd
 import geoengine_openapi_client
-from geoengine import api
+from geoengine import api, backports
 from geoengine.error import InputException, MissingFieldInResponseException
 from geoengine.auth import get_session
 from geoengine.types import Provenance, RasterSymbology, TimeStep, \
@@ -43,7 +44,7 @@ class OgrSourceTimeFormat:
 
     @classmethod
     def auto(cls) -> AutoOgrSourceTimeFormat:
-        return AutoOgrSourceTimeFormat()
+        return AUTO_OGR_SOURCE_TIME_FORMAT
 
     @classmethod
     def custom(cls, format_string: str) -> CustomOgrSourceTimeFormat:
@@ -72,6 +73,10 @@ class AutoOgrSourceTimeFormat(OgrSourceTimeFormat):
         ))
 
 
+# parameterless formats are shared instead of being created on every use
+AUTO_OGR_SOURCE_TIME_FORMAT = AutoOgrSourceTimeFormat()
+
+
 @dataclass
 class CustomOgrSourceTimeFormat(OgrSourceTimeFormat):
     '''A custom OGR time format'''
@@ -94,11 +99,11 @@ class OgrSourceDuration():
 
     @classmethod
     def zero(cls) -> ZeroOgrSourceDurationSpec:
-        return ZeroOgrSourceDurationSpec()
+        return ZERO_OGR_SOURCE_DURATION_SPEC
 
     @classmethod
     def infinite(cls) -> InfiniteOgrSourceDurationSpec:
-        return InfiniteOgrSourceDurationSpec()
+        return INFINITE_OGR_SOURCE_DURATION_SPEC
 
     @classmethod
     def value(
@@ -143,6 +148,10 @@ class InfiniteOgrSourceDurationSpec(OgrSourceDuration):
         ))
 
 
+ZERO_OGR_SOURCE_DURATION_SPEC = ZeroOgrSourceDurationSpec()
+INFINITE_OGR_SOURCE_DURATION_SPEC = InfiniteOgrSourceDurationSpec()
+
+
 class OgrSourceDatasetTimeType:
     '''A time type specification for OGR dataset definitions'''
 
@@ -152,7 +161,7 @@ class OgrSourceDatasetTimeType:
 
     @classmethod
     def none(cls) -> NoneOgrSourceDatasetTimeType:
-        return NoneOgrSourceDatasetTimeType()
+        return NONE_OGR_SOURCE_DATASET_TIME_TYPE
 
     @classmethod
     def start(cls,
@@ -190,6 +199,9 @@ class NoneOgrSourceDatasetTimeType(OgrSourceDatasetTimeType):
         ))
 
 
+NONE_OGR_SOURCE_DATASET_TIME_TYPE = NoneOgrSourceDatasetTimeType()
+
+
 @dataclass
 class StartOgrSourceDatasetTimeType(OgrSourceDatasetTimeType):
     '''Specify a start column and a fixed duration'''
@@ -292,9 +304,11 @@ class UploadId:
     '''A wrapper for an upload id'''
 
     __upload_id: UUID
+    __upload_id_str: str
 
     def __init__(self, upload_id: UUID) -> None:
         self.__upload_id = upload_id
+        self.__upload_id_str = str(upload_id)
 
     @classmethod
     def from_response(cls, response: geoengine_openapi_client.AddCollection200Response) -> UploadId:
@@ -302,7 +316,7 @@ class UploadId:
         return UploadId(UUID(response.id))
 
     def __str__(self) -> str:
-        return str(self.__upload_id)
+        return self.__upload_id_str
 
     def __repr__(self) -> str:
         return str(self)
@@ -317,7 +331,7 @@ class UploadId:
     def to_api_dict(self) -> geoengine_openapi_client.AddCollection200Response:
         '''Converts the upload id to a dict for the api'''
         return geoengine_openapi_client.AddCollection200Response(
-            id=str(self.__upload_id)
+            id=self.__upload_id_str
         )
 
 
@@ -382,6 +396,7 @@ class VolumeId:
         return self.__volume_id == other.__volume_id  # pylint: disable=protected-access
 
 
+@lru_cache(maxsize=32)
 def pandas_dtype_to_column_type(dtype: np.dtype) -> FeatureDataType:
     '''Convert a pandas `dtype` to a column type'''
 
@@ -443,72 +458,108 @@ def upload_dataframe(
 
     session = get_session()
 
-    df_json = df.to_json()
+    first_geometry = df.geometry.iloc[0]
+    if first_geometry is None:
+        raise InputException("Invalid vector data type")
 
-    with tempfile.TemporaryDirectory() as temp_dir, \
-            geoengine_openapi_client.ApiClient(session.configuration) as api_client:
-        json_file_name = Path(temp_dir) / 'geo.json'
-        with open(json_file_name, 'w', encoding='utf8') as json_file:
-            json_file.write(df_json)
+    vector_type = VectorDataType.from_geopandas_type_name(first_geometry.geom_type)
 
-        uploads_api = geoengine_openapi_client.UploadsApi(api_client)
-        response = uploads_api.upload_handler([str(json_file_name)], _request_timeout=timeout)
+    column_names_by_type: Dict[FeatureDataType, List[str]] = {
+        FeatureDataType.FLOAT: [],
+        FeatureDataType.INT: [],
+        FeatureDataType.TEXT: [],
+    }
 
-    upload_id = UploadId.from_response(response)
+    # columns of the same type share their (read-only) info instead of allocating one per column
+    column_infos = {data_type: VectorColumnInfo(data_type=data_type, measurement=UnitlessMeasurement())
+                    for data_type in column_names_by_type}
 
-    vector_type = VectorDataType.from_geopandas_type_name(df.geom_type[0])
+    # keep the column order of the dataframe, `pandas_dtype_to_column_type` is memoized per dtype
+    columns: Dict[str, VectorColumnInfo] = {}
+    for (key, dtype) in df.dtypes.items():
+        if isinstance(dtype, gpd.array.GeometryDtype):
+            continue
 
-    columns = {key: VectorColumnInfo(data_type=pandas_dtype_to_column_type(value), measurement=UnitlessMeasurement())
-               for (key, value) in df.dtypes.items()
-               if str(value) != 'geometry'}
+        data_type = pandas_dtype_to_column_type(dtype)
+        columns[key] = column_infos[data_type]
+        column_names_by_type[data_type].append(key)
 
-    floats = [key for (key, value) in columns.items() if value.data_type == 'float']
-    ints = [key for (key, value) in columns.items() if value.data_type == 'int']
-    texts = [key for (key, value) in columns.items() if value.data_type == 'text']
+    floats = column_names_by_type[FeatureDataType.FLOAT]
+    ints = column_names_by_type[FeatureDataType.INT]
+    texts = column_names_by_type[FeatureDataType.TEXT]
 
-    create = geoengine_openapi_client.CreateDataset(
-        data_path=geoengine_openapi_client.DataPath(geoengine_openapi_client.DataPathOneOf1(
-            upload=str(upload_id)
-        )),
-        definition=geoengine_openapi_client.DatasetDefinition(
-            properties=AddDatasetProperties(
-                display_name=display_name,
-                name=name,
-                description='Upload from Python',
-                source_operator='OgrSource',
-            ).to_api_dict(),
-            meta_data=geoengine_openapi_client.MetaDataDefinition(geoengine_openapi_client.OgrMetaDataWithType(
-                type='OgrMetaData',
-                loading_info=geoengine_openapi_client.OgrSourceDataset(
-                    file_name='geo.json',
-                    layer_name='geo',
-                    data_type=vector_type.to_api_enum(),
-                    time=time.to_api_dict(),
-                    columns=geoengine_openapi_client.OgrSourceColumnSpec(
-                        y='',
-                        x='',
-                        float=floats,
-                        int=ints,
-                        text=texts,
-                    ),
-                    on_error=on_error.to_api_enum(),
-                ),
-                result_descriptor=VectorResultDescriptor(
-                    data_type=vector_type,
-                    spatial_reference=df.crs.to_string(),
-                    columns=columns,
-                ).to_api_dict().actual_instance
+    with session.api_client as api_client:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_file_name = Path(temp_dir) / 'geo.json'
+            # GDAL's writer serializes the features in C instead of building a Python string
+            df.to_file(json_file_name, driver='GeoJSON', engine='pyogrio')
+
+            uploads_api = geoengine_openapi_client.UploadsApi(api_client)
+            response = uploads_api.upload_handler([str(json_file_name)], _request_timeout=timeout)
+
+        upload_id = UploadId.from_response(response)
+
+        create = geoengine_openapi_client.CreateDataset(
+            data_path=geoengine_openapi_client.DataPath(geoengine_openapi_client.DataPathOneOf1(
+                upload=str(upload_id)
             )),
+            definition=geoengine_openapi_client.DatasetDefinition(
+                properties=AddDatasetProperties(
+                    display_name=display_name,
+                    name=name,
+                    description='Upload from Python',
+                    source_operator='OgrSource',
+                ).to_api_dict(),
+                meta_data=geoengine_openapi_client.MetaDataDefinition(geoengine_openapi_client.OgrMetaDataWithType(
+                    type='OgrMetaData',
+                    loading_info=geoengine_openapi_client.OgrSourceDataset(
+                        file_name='geo.json',
+                        layer_name='geo',
+                        data_type=vector_type.to_api_enum(),
+                        time=time.to_api_dict(),
+                        columns=geoengine_openapi_client.OgrSourceColumnSpec(
+                            y='',
+                            x='',
+                            float=floats,
+                            int=ints,
+                            text=texts,
+                        ),
+                        on_error=on_error.to_api_enum(),
+                    ),
+                    result_descriptor=VectorResultDescriptor(
+                        data_type=vector_type,
+                        spatial_reference=df.crs.to_string(),
+                        columns=columns,
+                    ).to_api_dict().actual_instance
+                )),
+            )
         )
-    )
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
         datasets_api = geoengine_openapi_client.DatasetsApi(api_client)
         response2 = datasets_api.create_dataset_handler(create, _request_timeout=timeout)
 
     return DatasetName.from_response(response2)
 
 
+async def upload_dataframe_async(
+        df: gpd.GeoDataFrame,
+        display_name: str = "Upload from Python",
+        name: Optional[str] = None,
+        time: OgrSourceDatasetTimeType = OgrSourceDatasetTimeType.none(),
+        on_error: OgrOnError = OgrOnError.ABORT,
+        timeout: int = 3600) -> DatasetName:
+    """
+    Uploads a given dataframe to Geo Engine without blocking the event loop.
+
+    Multiple uploads can run concurrently, e.g., via `asyncio.gather`, and share the pooled connections of the session.
+    See `upload_dataframe` for the parameters.
+    """
+    # pylint: disable=too-many-arguments
+
+    # TODO: use `asyncio.to_thread` when min Python version is 3.9
+    return await backports.to_thread(upload_dataframe, df, display_name, name, time, on_error, timeout)
+
+
 class StoredDataset(NamedTuple):
     '''The result of a store dataset request is a combination of `upload_id` and `dataset_name`'''
 
@@ -554,7 +605,7 @@ def volumes(timeout: int = 60) -> List[Volume]:
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         datasets_api = geoengine_openapi_client.DatasetsApi(api_client)
         response = datasets_api.list_volumes_handler(_request_timeout=timeout)
 
@@ -586,7 +637,7 @@ def add_dataset(data_store: Union[Volume, UploadId],
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         datasets_api = geoengine_openapi_client.DatasetsApi(api_client)
         response = datasets_api.create_dataset_handler(create, _request_timeout=timeout)
 
@@ -598,7 +649,7 @@ def delete_dataset(dataset_name: DatasetName, timeout: int = 60) -> None:
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         datasets_api = geoengine_openapi_client.DatasetsApi(api_client)
         datasets_api.delete_dataset_handler(str(dataset_name), _request_timeout=timeout)
 
@@ -617,7 +668,7 @@ def list_datasets(offset: int = 0,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         datasets_api = geoengine_openapi_client.DatasetsApi(api_client)
         response = datasets_api.list_datasets_handler(
             offset=offset,
@@ -3,7 +3,7 @@ Package errors and backend mapped error types
 '''
 
 from typing import Any, Dict, Union
-import json
+import orjson
 from requests import Response, HTTPError
 import geoengine_openapi_client
 
@@ -20,12 +20,12 @@ class GeoEngineException(Exception):
         super().__init__()
 
         if isinstance(response, geoengine_openapi_client.ApiException):
-            obj = json.loads(response.body)
+            obj = orjson.loads(response.body)
         else:
             obj = response
 
-        self.error = obj['error'] if 'error' in obj else '?'
-        self.message = obj['message'] if 'message' in obj else '?'
+        self.error = obj.get('error', '?')
+        self.message = obj.get('message', '?')
 
     def __str__(self) -> str:
         return f"{self.error}: {self.message}"
@@ -180,12 +180,12 @@ def check_response_for_error(response: Response) -> None:
 
     # try to parse it as a Geo Engine error
     try:
-        response_json = response.json()
+        response_json = orjson.loads(response.content)
     except Exception:  # pylint: disable=broad-except
         pass  # ignore errors, it seemed not to be JSON
     else:
         # if parsing was successful, raise the appropriate exception
-        if 'error' in response_json:
+        if isinstance(response_json, dict) and response_json.get('error') is not None:
             raise GeoEngineException(response_json)
 
     # raise `HTTPError` if `GeoEngineException` or any other was not thrown
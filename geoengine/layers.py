@@ -414,7 +414,7 @@ class LayerCollection:
         ]:
             raise ValueError(f'Invalid search type {search_type}')
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             layers_api = geoengine_openapi_client.LayersApi(api_client)
             layer_collection_response = layers_api.search_handler(
                 provider=str(self.provider_id),
@@ -558,7 +558,7 @@ class Layer:
         '''
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             layers_api = geoengine_openapi_client.LayersApi(api_client)
             response = layers_api.layer_to_dataset(str(self.provider_id), str(self.layer_id), _request_timeout=timeout)
 
@@ -585,7 +585,7 @@ class Layer:
         '''
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             layers_api = geoengine_openapi_client.LayersApi(api_client)
             response = layers_api.layer_to_workflow_id_handler(
                 str(self.provider_id),
@@ -618,7 +618,7 @@ def layer_collection(layer_collection_id: Optional[LayerCollectionId] = None,
 
     offset = 0
     while True:
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             layers_api = geoengine_openapi_client.LayersApi(api_client)
 
             if layer_collection_id is None:
@@ -652,7 +652,7 @@ def layer(layer_id: LayerId,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         response = layers_api.layer_handler(str(layer_provider_id), layer_id, _request_timeout=timeout)
 
@@ -666,7 +666,7 @@ def _delete_layer_from_collection(collection_id: LayerCollectionId,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         layers_api.remove_layer_from_collection(collection_id, layer_id, _request_timeout=timeout)
 
@@ -678,7 +678,7 @@ def _delete_layer_collection_from_collection(parent_id: LayerCollectionId,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         layers_api.remove_collection_from_collection(parent_id, collection_id, _request_timeout=timeout)
 
@@ -689,7 +689,7 @@ def _delete_layer_collection(collection_id: LayerCollectionId,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         layers_api.remove_collection(collection_id, _request_timeout=timeout)
 
@@ -702,7 +702,7 @@ def _add_layer_collection_to_collection(name: str,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         response = layers_api.add_collection(
             parent_collection_id,
@@ -723,7 +723,7 @@ def _add_existing_layer_collection_to_collection(collection_id: LayerCollectionI
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         layers_api.add_existing_collection_to_collection(parent_collection_id, collection_id, _request_timeout=timeout)
 
@@ -745,7 +745,7 @@ def _add_layer_to_collection(name: str,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         response = layers_api.add_layer(
             collection_id,
@@ -768,6 +768,6 @@ def _add_existing_layer_to_collection(layer_id: LayerId,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         layers_api = geoengine_openapi_client.LayersApi(api_client)
         layers_api.add_existing_layer_to_collection(collection_id, layer_id, _request_timeout=timeout)
@@ -139,7 +139,7 @@ def add_permission(role: RoleId, resource: Resource, permission: Permission, tim
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         permissions_api = geoengine_openapi_client.PermissionsApi(api_client)
         permissions_api.add_permission_handler(geoengine_openapi_client.PermissionRequest(
             role_id=str(role),
@@ -154,7 +154,7 @@ def remove_permission(role: RoleId, resource: Resource, permission: Permission,
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         permissions_api = geoengine_openapi_client.PermissionsApi(api_client)
         permissions_api.remove_permission_handler(geoengine_openapi_client.PermissionRequest(
             role_id=str(role),
@@ -169,7 +169,7 @@ def add_role(name: str, timeout: int = 60) -> RoleId:
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         user_api = geoengine_openapi_client.UserApi(api_client)
         response = user_api.add_role_handler(geoengine_openapi_client.AddRole(
             name=name,
@@ -188,7 +188,7 @@ def remove_role(role: RoleId, timeout: int = 60):
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         user_api = geoengine_openapi_client.UserApi(api_client)
         user_api.remove_role_handler(str(role), _request_timeout=timeout)
 
@@ -198,7 +198,7 @@ def assign_role(role: RoleId, user: UserId, timeout: int = 60):
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         user_api = geoengine_openapi_client.UserApi(api_client)
         user_api.assign_role_handler(str(user), str(role), _request_timeout=timeout)
 
@@ -208,6 +208,6 @@ def revoke_role(role: RoleId, user: UserId, timeout: int = 60):
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         user_api = geoengine_openapi_client.UserApi(api_client)
         user_api.revoke_role_handler(str(user), str(role), _request_timeout=timeout)
@@ -222,7 +222,7 @@ class Task:
 
         task_id_str = str(self.__task_id)
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             tasks_api = geoengine_openapi_client.TasksApi(api_client)
             response = tasks_api.status_handler(task_id_str, _request_timeout=timeout)
 
@@ -236,7 +236,7 @@ class Task:
 
         task_id_str = str(self.__task_id)
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             tasks_api = geoengine_openapi_client.TasksApi(api_client)
             tasks_api.abort_handler(
                 task_id_str,
@@ -287,7 +287,7 @@ class Task:
         task_id_str = str(self.__task_id)
 
         last_status = None
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             tasks_api = geoengine_openapi_client.TasksApi(api_client)
             while True:
                 response = await backports.to_thread(get_status_inner, tasks_api, task_id_str)
@@ -309,7 +309,7 @@ def get_task_list(timeout: int = 3600) -> List[Tuple[Task, TaskStatusInfo]]:
     '''
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         tasks_api = geoengine_openapi_client.TasksApi(api_client)
         response = tasks_api.list_handler(None, 0, 10, _request_timeout=timeout)
 
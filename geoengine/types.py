@@ -1062,9 +1062,11 @@ class InternalDataId(DataId):
     '''An internal data id'''
 
     __dataset_id: UUID
+    __dataset_id_str: str
 
     def __init__(self, dataset_id: UUID):
         self.__dataset_id = dataset_id
+        self.__dataset_id_str = str(dataset_id)
 
     @classmethod
     def from_response_internal(cls, response: geoengine_openapi_client.InternalDataId) -> InternalDataId:
@@ -1074,11 +1076,11 @@ class InternalDataId(DataId):
     def to_api_dict(self) -> geoengine_openapi_client.DataId:
         return geoengine_openapi_client.DataId(geoengine_openapi_client.InternalDataId(
             type="internal",
-            dataset_id=str(self.__dataset_id)
+            dataset_id=self.__dataset_id_str
         ))
 
     def __str__(self) -> str:
-        return str(self.__dataset_id)
+        return self.__dataset_id_str
 
     def __repr__(self) -> str:
         '''Display representation of an internal data id'''
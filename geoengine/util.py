@@ -2,6 +2,8 @@
 Module for utility functions
 '''
 
+from functools import lru_cache
+from importlib.metadata import version
 
 import numpy as np
 
@@ -22,3 +24,10 @@ def clamp_datetime_ms_ns(value: np.datetime64) -> np.datetime64:
         return max_date
 
     return value.astype('datetime64[ns]')
+
+
+@lru_cache(maxsize=None)
+def user_agent() -> str:
+    '''The user agent of this library, e.g., `geoengine-python/0.8.0`. It is determined on first use.'''
+
+    return f'geoengine-python/{version("geoengine")}'
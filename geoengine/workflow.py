@@ -163,7 +163,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             workflows_api = geoengine_openapi_client.WorkflowsApi(api_client)
             response = workflows_api.get_workflow_metadata_handler(str(self.__workflow_id), _request_timeout=timeout)
 
@@ -183,7 +183,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             workflows_api = geoengine_openapi_client.WorkflowsApi(api_client)
             response = workflows_api.load_workflow_handler(str(self.__workflow_id), _request_timeout=timeout)
 
@@ -204,7 +204,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             wfs_api = geoengine_openapi_client.OGCWFSApi(api_client)
             response = wfs_api.wfs_feature_handler(
                 workflow=str(self.__workflow_id),
@@ -266,7 +266,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             wms_api = geoengine_openapi_client.OGCWMSApi(api_client)
             response = wms_api.wms_map_handler(
                 workflow=str(self),
@@ -295,7 +295,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             plots_api = geoengine_openapi_client.PlotsApi(api_client)
             response = plots_api.get_plot_handler(
                 bbox.bbox_str,
@@ -485,7 +485,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             workflows_api = geoengine_openapi_client.WorkflowsApi(api_client)
             response = workflows_api.get_workflow_provenance_handler(str(self.__workflow_id), _request_timeout=timeout)
 
@@ -498,7 +498,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             workflows_api = geoengine_openapi_client.WorkflowsApi(api_client)
             response = workflows_api.get_workflow_all_metadata_zip_handler(
                 str(self.__workflow_id),
@@ -526,7 +526,7 @@ class Workflow:
 
         session = get_session()
 
-        with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+        with session.api_client as api_client:
             workflows_api = geoengine_openapi_client.WorkflowsApi(api_client)
             response = workflows_api.dataset_from_workflow_handler(
                 str(self.__workflow_id),
@@ -909,7 +909,7 @@ def register_workflow(workflow: Union[Dict[str, Any], WorkflowBuilderOperator],
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         workflows_api = geoengine_openapi_client.WorkflowsApi(api_client)
         response = workflows_api.register_workflow_handler(workflow_model, _request_timeout=timeout)
 
@@ -933,7 +933,7 @@ def get_quota(user_id: Optional[UUID] = None, timeout: int = 60) -> geoengine_op
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         user_api = geoengine_openapi_client.UserApi(api_client)
 
         if user_id is None:
@@ -949,7 +949,7 @@ def update_quota(user_id: UUID, new_available_quota: int, timeout: int = 60) ->
 
     session = get_session()
 
-    with geoengine_openapi_client.ApiClient(session.configuration) as api_client:
+    with session.api_client as api_client:
         user_api = geoengine_openapi_client.UserApi(api_client)
         user_api.update_user_quota_handler(
             str(user_id),
@@ -1,6 +1,7 @@
 '''Test for utility functions'''
 
 import unittest
+from importlib.metadata import version
 import numpy as np
 import geoengine as ge
 
@@ -27,6 +28,9 @@ class TypesTests(unittest.TestCase):
             np.datetime64('2000-01-02 11:22:33.44', 'ns')
         )
 
+    def test_default_user_agent(self):
+        self.assertEqual(ge.DEFAULT_USER_AGENT, f'geoengine-python/{version("geoengine")}')
+
 
 if __name__ == '__main__':
     unittest.main()